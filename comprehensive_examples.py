@@ -4,9 +4,291 @@
 This file contains comprehensive examples, usage patterns, and documentation
 for the Conversation Management & Classification System with Groq API.
 
-Usage: Copy and paste these examples into your Jupyter notebook cells.
+Usage: After running the notebook cells that define the classes and
+GROQ_API_KEY, load the whole module with `%run -i comprehensive_examples.py`.
+The examples share module-level helpers and sample data, so individual
+functions cannot be copied into cells on their own.
 """
 
+import hashlib
+import json
+import math
+import sys
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib.util import find_spec
+
+try:
+    import orjson  # Optional: faster JSON encoding of cache keys
+except ImportError:
+    orjson = None
+
+# =============================================================================
+# SHARED CLIENT
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key):
+    """Create the GroqClient for an API key; cached so it is built only once."""
+    return GroqClient(api_key=api_key)
+
+
+def get_client():
+    """
+    Return the shared GroqClient for the configured GROQ_API_KEY.
+    
+    Every GroqClient holds its own HTTP connection pool, so reusing a single
+    instance across examples keeps connections to the Groq API open instead
+    of paying a new TCP and TLS handshake for each throwaway client.
+    """
+    return _client_for_key(GROQ_API_KEY)
+
+
+# =============================================================================
+# RESPONSE CACHING
+# =============================================================================
+
+# Responses above this temperature are sampled, so caching them would hide
+# the variation the caller asked for.
+CACHE_MAX_TEMPERATURE = 0.3
+CACHE_MAX_ENTRIES = 256
+
+_response_cache = OrderedDict()
+
+
+def _completion_cache_key(messages, kwargs):
+    """Build a stable hash of the message payload and every request option."""
+    request = {"messages": messages, "kwargs": kwargs}
+    if orjson is not None:
+        payload = orjson.dumps(request, default=repr, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(request, default=repr, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload).hexdigest()
+
+
+def cached_chat_completion(client, messages, parse=None, **kwargs):
+    """
+    Call ``client.chat_completion`` with an in-memory LRU cache in front of it.
+    
+    Identical prompts re-run across demo cells are answered from the cache
+    instead of making another round-trip to the Groq API. Requests without
+    an explicit temperature (the client default may be above the limit) or
+    with one above ``CACHE_MAX_TEMPERATURE`` always go to the API.
+    
+    If ``parse`` is given, the response is passed through it and the parsed
+    value is returned instead. Only the raw response text is cached and it is
+    parsed again on every hit, so callers never share mutable results. A
+    response that ``parse`` rejects by raising is never cached, so one
+    malformed reply is not replayed.
+    """
+    temperature = kwargs.get("temperature")
+    if temperature is None or temperature > CACHE_MAX_TEMPERATURE:
+        response = client.chat_completion(messages, **kwargs)
+        return parse(response) if parse is not None else response
+    
+    key = _completion_cache_key(messages, kwargs)
+    if key in _response_cache:
+        _response_cache.move_to_end(key)
+        response = _response_cache[key]
+        return parse(response) if parse is not None else response
+    
+    response = client.chat_completion(messages, **kwargs)
+    result = parse(response) if parse is not None else response
+    _response_cache[key] = response
+    if len(_response_cache) > CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+    return result
+
+
+def clear_response_cache():
+    """Drop all cached chat completion responses."""
+    _response_cache.clear()
+
+
+# =============================================================================
+# BATCH EXTRACTION
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _field_label(field):
+    """Display label for an extracted field, computed once per field name."""
+    return field.title()
+
+
+@lru_cache(maxsize=None)
+def _extraction_system_prompt(fields):
+    """
+    Build the batch extraction system prompt for a tuple of schema fields.
+    
+    Cached so the same schema always yields the identical string, which Groq
+    can serve from its prompt cache.
+    """
+    return (
+        "You extract customer information from chat transcripts. "
+        f"For each numbered chat, extract the fields: {', '.join(fields)}. "
+        "Return only a JSON list with one object per chat, in the same order. "
+        "Each object must contain exactly those keys plus \"confidence\" "
+        "(a number from 0.0 to 1.0). Use null for missing fields."
+    )
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_list(response):
+    """Decode the first JSON list in a model response, skipping any surrounding prose."""
+    start = response.find("[")
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(response, start)
+        except ValueError:
+            pass
+        else:
+            if isinstance(value, list):
+                return value
+        start = response.find("[", start + 1)
+    raise ValueError("Response does not contain a JSON list")
+
+
+def _schema_errors(extractor, extracted_data):
+    """Validate extracted values with the extractor's schema validator."""
+    # Missing fields stay out of the check; the schema has no required fields
+    present = {field: value for field, value in extracted_data.items() if value is not None}
+    if extractor.validate_extraction(present):
+        return []
+    return ["Extracted data does not match the extraction schema"]
+
+
+def extract_batch(client, extractor, texts):
+    """
+    Extract customer information from several chat texts with one API call.
+    
+    All texts are numbered into a single user message, sent after a fixed
+    system prompt that asks for the fields in the extractor's schema. The
+    JSON list the model returns is split back into one ExtractionResult per
+    input, in input order, with each item checked by the extractor's
+    validate_extraction().
+    
+    Raises:
+        ValueError: If the response is not a JSON list of the expected length
+    """
+    if not texts:
+        return []
+    
+    fields = tuple(extractor.get_extraction_schema()["properties"])
+    numbered = "\n".join(f"{n}) {text}" for n, text in enumerate(texts, 1))
+    messages = [
+        {"role": "system", "content": _extraction_system_prompt(fields)},
+        {"role": "user", "content": numbered},
+    ]
+    
+    def parse_reply(response):
+        items = _parse_json_list(response)
+        if len(items) != len(texts):
+            raise ValueError(f"Expected {len(texts)} extraction results, got {len(items)}")
+        return items
+    
+    items = cached_chat_completion(client, messages, parse=parse_reply, temperature=0.1)
+    
+    results = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append(ExtractionResult(
+                extracted_data={field: None for field in fields},
+                validation_errors=["Batch item is not a JSON object"],
+                raw_response={"item": item}
+            ))
+            continue
+        
+        try:
+            confidence = float(item.get("confidence") or 0.0)
+        except (TypeError, ValueError):
+            confidence = 0.0
+        # json accepts NaN and Infinity literals, which ExtractionResult rejects
+        if not math.isfinite(confidence):
+            confidence = 0.0
+        confidence = min(max(confidence, 0.0), 1.0)
+        
+        extracted_data = {field: item.get(field) for field in fields}
+        results.append(ExtractionResult(
+            extracted_data=extracted_data,
+            confidence_score=confidence,
+            validation_errors=_schema_errors(extractor, extracted_data),
+            raw_response={"item": item}
+        ))
+    return results
+
+
+# =============================================================================
+# OUTPUT BUFFERING
+# =============================================================================
+
+def _write_lines(lines):
+    """Write buffered output lines in one call, then empty the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+@contextmanager
+def _buffered_lines():
+    """Collect output lines and write them on exit, even if the block raises."""
+    lines = []
+    try:
+        yield lines
+    finally:
+        _write_lines(lines)
+
+
+# =============================================================================
+# SAMPLE DATA
+# =============================================================================
+
+# (role, content) turns for the basic conversation example
+SAMPLE_MESSAGES = (
+    ("user", "Hello, I'm John Doe and I need help with my account"),
+    ("assistant", "Hello John! I'd be happy to help you with your account. What specific issue are you experiencing?"),
+    ("user", "I can't log in to my account. My email is john.doe@email.com"),
+    ("assistant", "I understand you're having trouble logging in. Let me help you troubleshoot this issue."),
+    ("user", "Thank you! Also, I'm 35 years old and live in San Francisco if that helps"),
+)
+
+# (name, text) chats for the information extraction example
+SAMPLE_CHATS = (
+    ("Customer Service Chat", "Hi, I'm Sarah Johnson. You can reach me at sarah.johnson@email.com or call me at +1-555-0123. I'm 28 years old and live in New York City."),
+    ("Support Request", "Hello, my name is Michael Chen, I'm 42 and I live in Los Angeles. My phone number is (555) 987-6543."),
+    ("Partial Information", "I'm Alex and I'm 25 years old. I don't want to share my contact details right now."),
+)
+
+# (role, content) turns for the summarization example
+SUMMARIZATION_TURNS = (
+    ("user", "Hi, I need help setting up my new account"),
+    ("assistant", "I'd be happy to help you set up your account. What's your name?"),
+    ("user", "My name is Emma Wilson and my email is emma.wilson@company.com"),
+    ("assistant", "Thank you Emma. I've noted your email address. What type of account would you like to create?"),
+    ("user", "I need a business account for my consulting company"),
+    ("assistant", "Perfect! A business account will give you access to advanced features. Let me walk you through the setup process."),
+    ("user", "That sounds great. I'm located in Seattle, Washington if that matters for the setup"),
+    ("assistant", "Thank you for that information. Your location helps us configure the right settings for your account."),
+)
+
+# (role, content) turns for the complete system demonstration
+SUPPORT_CONVERSATION_SCRIPT = (
+    ("user", "Hello, I'm having trouble with my account login"),
+    ("assistant", "I'm sorry to hear you're having login issues. I'd be happy to help you resolve this. Can you please provide your name and email address?"),
+    ("user", "Sure, my name is Jennifer Martinez and my email is jennifer.martinez@techcorp.com"),
+    ("assistant", "Thank you Jennifer. I can see your account in our system. What specific error message are you seeing when you try to log in?"),
+    ("user", "It says 'Invalid credentials' but I'm sure my password is correct. I'm 34 years old and I've been using this account for 2 years"),
+    ("assistant", "I understand your frustration. Let me check your account status. It's possible your password may have expired or there might be a security lock on your account."),
+    ("user", "That makes sense. By the way, I'm calling from Denver, Colorado and my phone number is (303) 555-7890 in case you need to reach me"),
+    ("assistant", "Perfect, I've noted your contact information. Let me reset your account status and send you a password reset link to jennifer.martinez@techcorp.com"),
+)
+
+
 # =============================================================================
 # USAGE EXAMPLES
 # =============================================================================
@@ -26,7 +308,7 @@ def example_basic_conversation_management():
     
     try:
         # Initialize the conversation manager
-        groq_client = GroqClient(api_key=GROQ_API_KEY)
+        groq_client = get_client()
         conversation_manager = ConversationManager(
             groq_client=groq_client,
             summarization_threshold=5
@@ -35,22 +317,14 @@ def example_basic_conversation_management():
         print("✅ Conversation manager initialized successfully")
         
         # Add sample conversation
-        sample_messages = [
-            ("user", "Hello, I'm John Doe and I need help with my account"),
-            ("assistant", "Hello John! I'd be happy to help you with your account. What specific issue are you experiencing?"),
-            ("user", "I can't log in to my account. My email is john.doe@email.com"),
-            ("assistant", "I understand you're having trouble logging in. Let me help you troubleshoot this issue."),
-            ("user", "Thank you! Also, I'm 35 years old and live in San Francisco if that helps")
-        ]
-        
-        for role, content in sample_messages:
-            conversation_manager.add_message(role, content)
-            print(f"  📝 Added {role} message: {content[:50]}...")
+        with _buffered_lines() as added_lines:
+            for role, content in SAMPLE_MESSAGES:
+                conversation_manager.add_message(role, content)
+                added_lines.append(f"  📝 Added {role} message: {content[:50]}...")
         
         # Display conversation stats
-        history = conversation_manager.get_conversation_history()
         print(f"\n📊 Conversation Statistics:")
-        print(f"  💬 Total messages: {len(history)}")
+        print(f"  💬 Total messages: {conversation_manager.conversation_history.get_message_count()}")
         print(f"  🔄 User turns: {conversation_manager.conversation_history.total_turns}")
         print(f"  📝 Has summary: {bool(conversation_manager.conversation_history.summary)}")
         print(f"  ⚡ Should summarize: {conversation_manager.should_summarize()}")
@@ -66,7 +340,7 @@ def example_information_extraction():
     
     Demonstrates:
     - Initializing the information extractor
-    - Processing multiple sample chats
+    - Processing multiple sample chats in a single batched API call
     - Handling extraction results and validation
     - Displaying formatted results
     """
@@ -74,33 +348,28 @@ def example_information_extraction():
     print("=" * 50)
     
     try:
-        # Initialize information extractor
+        # Initialize information extractor on the shared client
+        groq_client = get_client()
         extractor = InformationExtractor(groq_client)
         print("✅ Information extractor initialized")
         
-        # Sample chat texts for extraction
-        sample_chats = [
-            {
-                "name": "Customer Service Chat",
-                "text": "Hi, I'm Sarah Johnson. You can reach me at sarah.johnson@email.com or call me at +1-555-0123. I'm 28 years old and live in New York City."
-            },
-            {
-                "name": "Support Request",
-                "text": "Hello, my name is Michael Chen, I'm 42 and I live in Los Angeles. My phone number is (555) 987-6543."
-            },
-            {
-                "name": "Partial Information",
-                "text": "I'm Alex and I'm 25 years old. I don't want to share my contact details right now."
-            }
-        ]
+        # Extract all samples with a single batched API call, falling back to
+        # one call per sample if the batch response cannot be used
+        try:
+            batch_results = extract_batch(groq_client, extractor, [text for _, text in SAMPLE_CHATS])
+        except Exception as e:
+            print(f"⚠️ Batch extraction failed, extracting samples one by one: {e}")
+            batch_results = None
         
-        # Extract information from each sample
-        for i, sample in enumerate(sample_chats, 1):
-            print(f"\n📋 Sample {i}: {sample['name']}")
-            print(f"📝 Text: {sample['text']}")
+        for i, (name, text) in enumerate(SAMPLE_CHATS, 1):
+            print(f"\n📋 Sample {i}: {name}")
+            print(f"📝 Text: {text}")
             
             try:
-                result = extractor.extract_information(sample['text'])
+                if batch_results is not None:
+                    result = batch_results[i - 1]
+                else:
+                    result = extractor.extract_information(text)
                 
                 print(f"\n🎯 Extraction Results:")
                 print(f"  📊 Confidence: {result.confidence_score:.1%}")
@@ -111,7 +380,7 @@ def example_information_extraction():
                 for field, value in result.extracted_data.items():
                     status = "✓" if value else "✗"
                     display_value = value if value else "Not found"
-                    print(f"    {status} {field.title()}: {display_value}")
+                    print(f"    {status} {_field_label(field)}: {display_value}")
                 
                 if result.validation_errors:
                     print(f"\n⚠️ Validation Errors:")
@@ -143,51 +412,41 @@ def example_summarization_strategies():
     try:
         # Create a longer conversation for summarization testing
         long_conversation = ConversationManager(
-            groq_client=groq_client,
+            groq_client=get_client(),
             summarization_threshold=3  # Lower threshold for demo
         )
         
-        # Add multiple conversation turns
-        conversation_turns = [
-            ("user", "Hi, I need help setting up my new account"),
-            ("assistant", "I'd be happy to help you set up your account. What's your name?"),
-            ("user", "My name is Emma Wilson and my email is emma.wilson@company.com"),
-            ("assistant", "Thank you Emma. I've noted your email address. What type of account would you like to create?"),
-            ("user", "I need a business account for my consulting company"),
-            ("assistant", "Perfect! A business account will give you access to advanced features. Let me walk you through the setup process."),
-            ("user", "That sounds great. I'm located in Seattle, Washington if that matters for the setup"),
-            ("assistant", "Thank you for that information. Your location helps us configure the right settings for your account.")
-        ]
-        
         print("📝 Adding conversation messages...")
-        for role, content in conversation_turns:
-            long_conversation.add_message(role, content)
-            turns = long_conversation.conversation_history.total_turns
-            should_summarize = long_conversation.should_summarize()
-            print(f"  Turn {turns}: {role} - Should summarize: {should_summarize}")
+        with _buffered_lines() as progress_lines:
+            for role, content in SUMMARIZATION_TURNS:
+                long_conversation.add_message(role, content)
+                turns = long_conversation.conversation_history.total_turns
+                should_summarize = long_conversation.should_summarize()
+                progress_lines.append(f"  Turn {turns}: {role} - Should summarize: {should_summarize}")
             
-            # Trigger summarization when threshold is reached
-            if should_summarize and turns >= 3:
-                print("\n🔄 Triggering summarization...")
-                try:
-                    summary = long_conversation.force_summarize()
-                    print(f"✅ Summarization completed")
-                    print(f"📝 Summary: {summary[:100]}...")
+                # Trigger summarization when threshold is reached
+                if should_summarize and turns >= 3:
+                    _write_lines(progress_lines)
+                    print("\n🔄 Triggering summarization...")
+                    try:
+                        summary = long_conversation.force_summarize()
+                        # Show conversation state after summarization
+                        history = long_conversation.conversation_history
+                        print(
+                            f"✅ Summarization completed\n"
+                            f"📝 Summary: {summary[:100]}...\n"
+                            f"📊 Messages after summarization: {history.get_message_count()}\n"
+                            f"📝 Has summary: {bool(history.summary)}"
+                        )
+                        break
                     
-                    # Show conversation state after summarization
-                    remaining_messages = long_conversation.get_conversation_history()
-                    print(f"📊 Messages after summarization: {len(remaining_messages)}")
-                    print(f"📝 Has summary: {bool(long_conversation.conversation_history.summary)}")
-                    break
-                    
-                except Exception as e:
-                    print(f"❌ Summarization failed: {e}")
-                    print("💡 This might be due to API limits or model availability")
-                    break
+                    except Exception as e:
+                        print(f"❌ Summarization failed: {e}")
+                        print("💡 This might be due to API limits or model availability")
+                        break
         
         print("\n📊 Final Conversation State:")
-        final_history = long_conversation.get_conversation_history()
-        print(f"  💬 Current messages: {len(final_history)}")
+        print(f"  💬 Current messages: {long_conversation.conversation_history.get_message_count()}")
         print(f"  🔄 Total turns processed: {long_conversation.conversation_history.total_turns}")
         print(f"  📝 Summary available: {bool(long_conversation.conversation_history.summary)}")
         
@@ -241,7 +500,7 @@ def example_error_handling():
     # 4. Invalid message format for API
     print("\n4️⃣ Testing invalid message format:")
     try:
-        test_client = GroqClient(api_key=GROQ_API_KEY)
+        test_client = get_client()
         # This should fail due to empty messages
         response = test_client.chat_completion([])
         print("❌ Should have failed but didn't")
@@ -283,7 +542,6 @@ def run_system_diagnostics():
     print("=" * 50)
     
     # Check Python version
-    import sys
     python_version = sys.version_info
     print(f"🐍 Python Version: {python_version.major}.{python_version.minor}.{python_version.micro}")
     if python_version >= (3, 7):
@@ -300,7 +558,7 @@ def run_system_diagnostics():
         
         # Test API key validity
         try:
-            test_client = GroqClient(api_key=GROQ_API_KEY)
+            test_client = get_client()
             print("  ✅ API key format is valid")
             
             # Try a simple API call
@@ -323,14 +581,15 @@ def run_system_diagnostics():
         print("  ❌ API key not configured")
         print("  💡 Set GROQ_API_KEY environment variable or configure in code")
     
-    # Check required imports
+    # Check required third-party packages; standard-library modules ship with
+    # every supported Python version, which the version check above covers
     print(f"\n📦 Package Status:")
-    required_packages = ['openai', 'json', 'dataclasses', 'datetime', 'typing']
+    required_packages = ['openai', 'groq']
     for package in required_packages:
-        try:
-            __import__(package)
+        # find_spec only locates the package, so nothing is actually imported
+        if find_spec(package) is not None:
             print(f"  ✅ {package}: Available")
-        except ImportError:
+        else:
             print(f"  ❌ {package}: Missing")
             print(f"     💡 Install with: pip install {package}")
     
@@ -354,7 +613,7 @@ def complete_system_demonstration():
     print("\n🚀 Initializing System Components...")
     try:
         # Create main system components
-        demo_client = GroqClient(api_key=GROQ_API_KEY)
+        demo_client = get_client()
         demo_manager = ConversationManager(
             groq_client=demo_client,
             summarization_threshold=4  # Summarize after 4 user turns
@@ -370,61 +629,68 @@ def complete_system_demonstration():
         # Phase 1: Initial conversation
         print("\n📋 Phase 1: Building Conversation History")
         
-        conversation_script = [
-            ("user", "Hello, I'm having trouble with my account login"),
-            ("assistant", "I'm sorry to hear you're having login issues. I'd be happy to help you resolve this. Can you please provide your name and email address?"),
-            ("user", "Sure, my name is Jennifer Martinez and my email is jennifer.martinez@techcorp.com"),
-            ("assistant", "Thank you Jennifer. I can see your account in our system. What specific error message are you seeing when you try to log in?"),
-            ("user", "It says 'Invalid credentials' but I'm sure my password is correct. I'm 34 years old and I've been using this account for 2 years"),
-            ("assistant", "I understand your frustration. Let me check your account status. It's possible your password may have expired or there might be a security lock on your account."),
-            ("user", "That makes sense. By the way, I'm calling from Denver, Colorado and my phone number is (303) 555-7890 in case you need to reach me"),
-            ("assistant", "Perfect, I've noted your contact information. Let me reset your account status and send you a password reset link to jennifer.martinez@techcorp.com")
-        ]
-        
         # Add messages and track progress
-        for i, (role, content) in enumerate(conversation_script, 1):
-            demo_manager.add_message(role, content)
+        extraction_future = None
+        with _buffered_lines() as progress_lines:
+            for i, (role, content) in enumerate(SUPPORT_CONVERSATION_SCRIPT, 1):
+                demo_manager.add_message(role, content)
             
-            current_turns = demo_manager.conversation_history.total_turns
-            should_summarize = demo_manager.should_summarize()
+                current_turns = demo_manager.conversation_history.total_turns
+                should_summarize = demo_manager.should_summarize()
             
-            print(f"  {i:2d}. {role:9} | Turns: {current_turns} | Summarize: {should_summarize}")
-            print(f"      Content: {content[:60]}...")
+                progress_lines.append(f"  {i:2d}. {role:9} | Turns: {current_turns} | Summarize: {should_summarize}")
+                progress_lines.append(f"      Content: {content[:60]}...")
             
-            # Trigger summarization when threshold is reached
-            if should_summarize and current_turns >= 4:
-                print("\n🔄 Automatic Summarization Triggered!")
-                print("-" * 30)
+                # Trigger summarization when threshold is reached
+                if should_summarize and current_turns >= 4:
+                    _write_lines(progress_lines)
+                    print("\n🔄 Automatic Summarization Triggered!")
+                    print("-" * 30)
+                
+                    # Show before state
+                    before_messages = demo_manager.get_conversation_history()
+                    print(f"📊 Before summarization: {len(before_messages)} messages")
                 
-                # Show before state
-                before_messages = demo_manager.get_conversation_history()
-                print(f"📊 Before summarization: {len(before_messages)} messages")
+                    # Summarization and extraction are independent API calls, so run
+                    # them concurrently; extraction sees the full pre-summary text
+                    conversation_text = " ".join(msg.content for msg in before_messages)
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        summary_future = executor.submit(demo_manager.force_summarize)
+                        extraction_future = executor.submit(
+                            demo_extractor.extract_information, conversation_text
+                        )
                 
-                try:
-                    # Perform summarization
-                    summary = demo_manager.force_summarize()
+                    try:
+                        # Collect the summarization result
+                        summary = summary_future.result()
                     
-                    # Show after state
-                    after_messages = demo_manager.get_conversation_history()
-                    print(f"✅ Summarization completed")
-                    print(f"📊 After summarization: {len(after_messages)} messages")
-                    print(f"📝 Summary: {summary[:100]}...")
+                        # Show after state
+                        print(
+                            f"✅ Summarization completed\n"
+                            f"📊 After summarization: "
+                            f"{demo_manager.conversation_history.get_message_count()} messages\n"
+                            f"📝 Summary: {summary[:100]}..."
+                        )
                     
-                except Exception as e:
-                    print(f"❌ Summarization failed: {e}")
-                    print("💡 Continuing with demonstration...")
+                    except Exception as e:
+                        print(f"❌ Summarization failed: {e}")
+                        print("💡 Continuing with demonstration...")
                 
-                break
+                    break
         
         # Phase 2: Information extraction
         print("\n🔍 Phase 2: Information Extraction")
         print("-" * 40)
         
-        # Extract information from the conversation
-        conversation_text = " ".join([msg.content for msg in demo_manager.get_conversation_history()])
-        
+        # Extract information from the conversation, reusing the extraction that
+        # ran alongside summarization when it was triggered
+        extraction_result = None
         try:
-            extraction_result = demo_extractor.extract_information(conversation_text)
+            if extraction_future is not None:
+                extraction_result = extraction_future.result()
+            else:
+                conversation_text = " ".join(msg.content for msg in demo_manager.get_conversation_history())
+                extraction_result = demo_extractor.extract_information(conversation_text)
             
             print(f"📊 Extraction Results:")
             print(f"  🎯 Confidence: {extraction_result.confidence_score:.1%}")
@@ -435,7 +701,7 @@ def complete_system_demonstration():
             for field, value in extraction_result.extracted_data.items():
                 status = "✓" if value else "✗"
                 display_value = value if value else "Not found"
-                print(f"  {status} {field.title():10}: {display_value}")
+                print(f"  {status} {_field_label(field):10}: {display_value}")
             
             if extraction_result.validation_errors:
                 print(f"\n⚠️ Validation Issues:")
@@ -449,8 +715,8 @@ def complete_system_demonstration():
         print("\n📊 Phase 3: Final System Status")
         print("-" * 40)
         
-        final_history = demo_manager.get_conversation_history()
-        print(f"💬 Final message count: {len(final_history)}")
+        final_message_count = demo_manager.conversation_history.get_message_count()
+        print(f"💬 Final message count: {final_message_count}")
         print(f"🔄 Total user turns: {demo_manager.conversation_history.total_turns}")
         print(f"📝 Has summary: {bool(demo_manager.conversation_history.summary)}")
         print(f"⏰ Last activity: {datetime.now().strftime('%H:%M:%S')}")
@@ -458,9 +724,9 @@ def complete_system_demonstration():
         # Success metrics
         print(f"\n🎉 Demonstration Results:")
         print(f"  ✅ Conversation management: Working")
-        print(f"  ✅ Message tracking: {len(final_history)} messages processed")
+        print(f"  ✅ Message tracking: {final_message_count} messages processed")
         print(f"  ✅ Summarization: {'Completed' if demo_manager.conversation_history.summary else 'Not triggered'}")
-        print(f"  ✅ Information extraction: {'Successful' if 'extraction_result' in locals() and extraction_result.has_data() else 'Partial'}")
+        print(f"  ✅ Information extraction: {'Successful' if extraction_result is not None and extraction_result.has_data() else 'Partial'}")
         print(f"  ✅ Error handling: Robust")
         
         print("\n🎯 Demonstration completed successfully!")
@@ -469,7 +735,6 @@ def complete_system_demonstration():
     except Exception as e:
         print(f"❌ Demonstration failed: {e}")
         print("💡 Check your API configuration and try again")
-        import traceback
         print(f"\n🔍 Error details:\n{traceback.format_exc()}")
 
 
@@ -565,8 +830,10 @@ USAGE_INSTRUCTIONS = """
 
 To use these examples in your Jupyter notebook:
 
-1. Copy the function definitions into a code cell
-2. Run the cell to define the functions
+1. Run the notebook cells that define GroqClient, ConversationManager,
+   InformationExtractor and GROQ_API_KEY
+2. Load this whole module into the notebook namespace:
+   %run -i comprehensive_examples.py
 3. Call individual functions to run specific examples:
 
 ```python
@@ -588,8 +855,10 @@ complete_system_demonstration()
 print(TROUBLESHOOTING_GUIDE)
 ```
 
-Each function is self-contained and includes comprehensive error handling
-and detailed output formatting for easy understanding.
+The examples share the module-level helpers and sample data (shared client,
+response cache, batch extraction, SAMPLE_* scripts), so run the whole module
+rather than copying individual functions. Each example includes
+comprehensive error handling and detailed output formatting.
 """
 
 if __name__ == "__main__":